@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 import sys
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 
 ROOT = Path(__file__).resolve().parent
@@ -14,7 +15,244 @@ SRC_PATH = ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from retention_guard.pipeline import run_pipeline  # noqa: E402
+from retention_guard.pipeline import RISK_BAND_LABELS, run_pipeline  # noqa: E402
+
+RISK_HIST_BINS = 20
+# Caches are shared across sessions; bound them so distinct uploads can't grow memory forever.
+CACHE_MAX_ENTRIES = 16
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _cached_run(
+    input_bytes: bytes | None, use_sample: bool, rows: int
+) -> tuple[pd.DataFrame, dict[str, float], float]:
+    """Run the pipeline once per unique input and return plain, hashable results.
+
+    This is the cross-session cache for training: the fitted sklearn model itself
+    is left out so Streamlit can pickle the entry and nothing large stays resident.
+    """
+    if use_sample:
+        # Sample flow: generates realistic-but-fake data for safe demos.
+        result, scored_df = run_pipeline(None, None, True, rows, write_csv=False)
+    else:
+        # Upload flow: parses the bytes in memory so concurrent sessions never
+        # share a file on disk.
+        result, scored_df = run_pipeline(
+            io.BytesIO(input_bytes or b""),
+            None,
+            False,
+            rows,
+            write_csv=False,
+        )
+    return scored_df, result.feature_importance, result.auc
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _dq_summary(df: pd.DataFrame) -> tuple[int, int, pd.DataFrame]:
+    """Return total missing values, duplicate IDs and missing counts per column."""
+    na_per_col = df.isna().sum()
+    missing_by_col = na_per_col.reset_index().rename(columns={"index": "column", 0: "missing"})
+    return int(na_per_col.sum()), int(df["employee_id"].duplicated().sum()), missing_by_col
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _risk_histogram(risk_scores: pd.Series) -> pd.DataFrame:
+    """Bin risk scores server-side so the chart ships bin counts, not raw points."""
+    counts, edges = np.histogram(risk_scores.to_numpy(), bins=RISK_HIST_BINS, range=(0, 1))
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    return pd.DataFrame({"risk_score": centers, "count": counts})
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _band_counts(risk_band: pd.Series) -> pd.DataFrame:
+    """Count employees per risk band, ordered Low -> High."""
+    counts = risk_band.value_counts().reindex(RISK_BAND_LABELS, fill_value=0)
+    return pd.DataFrame(
+        {
+            "risk_band": pd.Categorical(
+                RISK_BAND_LABELS, categories=RISK_BAND_LABELS, ordered=True
+            ),
+            "count": counts.to_numpy(),
+        }
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _dept_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """Average risk and headcount per department, riskiest first."""
+    return (
+        df.groupby("dept", as_index=False, observed=True)
+        .agg(avg_risk=("risk_score", "mean"), employees=("employee_id", "count"))
+        .sort_values("avg_risk", ascending=False)
+    )
+
+
+# Figure builders return plain dicts so the built figure is cached per input and
+# reruns skip Plotly Express construction. plotly is imported on demand since it
+# is only needed once results are rendered.
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _risk_distribution_fig(risk_hist: pd.DataFrame) -> dict:
+    import plotly.express as px
+
+    fig = px.bar(risk_hist, x="risk_score", y="count")
+    fig.update_traces(width=1 / RISK_HIST_BINS)
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _risk_bands_fig(band_counts: pd.DataFrame) -> dict:
+    import plotly.express as px
+
+    return px.bar(band_counts, x="risk_band", y="count").to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _top_drivers_fig(feature_importance: dict[str, float]) -> dict:
+    import plotly.express as px
+
+    drivers = pd.DataFrame(feature_importance.items(), columns=["feature", "weight"])
+    drivers = drivers.sort_values("weight", ascending=True)
+    return px.bar(drivers, x="weight", y="feature", orientation="h").to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _dept_overview_fig(dept_summary: pd.DataFrame) -> dict:
+    import plotly.express as px
+
+    fig = px.bar(
+        dept_summary,
+        x="dept",
+        y="avg_risk",
+        color="employees",
+        color_continuous_scale="Blues",
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _engagement_vs_risk_fig(scores: pd.DataFrame) -> dict:
+    import plotly.express as px
+
+    fig = px.scatter(
+        scores,
+        x="engagement_score",
+        y="risk_score",
+        color="risk_band",
+        hover_data=["employee_id", "dept"],
+        category_orders={"risk_band": RISK_BAND_LABELS},
+        render_mode="webgl",
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def _read_file_bytes(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+# Each results section is a fragment: interacting with one section reruns only
+# that section instead of the whole script.
+@st.fragment
+def _render_executive_snapshot(scores: pd.DataFrame) -> None:
+    st.subheader("Executive Snapshot")
+    kpi1, kpi2, kpi3, kpi4 = st.columns(4)
+    high_risk = scores[scores["risk_score"] >= 0.7]
+    with kpi1:
+        st.metric("Employees scored", len(scores))
+    with kpi2:
+        st.metric("High risk count", len(high_risk))
+    with kpi3:
+        st.metric("Avg risk score", f"{scores['risk_score'].mean():.2f}")
+    with kpi4:
+        high_pct = (len(high_risk) / len(scores)) * 100 if len(scores) else 0
+        st.metric("High risk %", f"{high_pct:.1f}%")
+
+    with st.expander("What does the model output mean?", expanded=False):
+        st.write(
+            "- **Risk score** is a 0–1 probability estimate from a baseline model.\n"
+            "- **Risk band** groups scores into Low (<0.4), Medium (0.4–0.69), High (>=0.7).\n"
+            "- **Top drivers** are the strongest overall model signals, not per-employee explanations."
+        )
+    with st.expander("How to interpret results", expanded=False):
+        st.write(
+            "- Use **High risk** to prioritize reviews, not to automate decisions.\n"
+            "- Compare **departments** to spot systemic issues.\n"
+            "- Track **engagement vs risk** to validate survey quality.\n"
+            "- Use the **scored CSV** as a starting point for deeper analysis."
+        )
+
+
+@st.fragment
+def _render_risk_distribution(scores: pd.DataFrame) -> None:
+    st.subheader("Risk Distribution")
+    risk_hist = _risk_histogram(scores["risk_score"])
+    st.plotly_chart(_risk_distribution_fig(risk_hist), use_container_width=True)
+
+
+@st.fragment
+def _render_risk_bands(scores: pd.DataFrame) -> None:
+    st.subheader("Risk Bands")
+    band_counts = _band_counts(scores["risk_band"])
+    st.plotly_chart(_risk_bands_fig(band_counts), use_container_width=True)
+
+
+@st.fragment
+def _render_top_drivers(feature_importance: dict[str, float]) -> None:
+    st.subheader("Top Drivers (overall)")
+    st.plotly_chart(_top_drivers_fig(feature_importance), use_container_width=True)
+
+
+@st.fragment
+def _render_data_quality(scores: pd.DataFrame) -> None:
+    st.subheader("Data Quality & Coverage")
+    missing_total, dupes, missing_by_col = _dq_summary(scores)
+    dq1, dq2, dq3 = st.columns(3)
+    with dq1:
+        st.metric("Missing values", missing_total)
+    with dq2:
+        st.metric("Duplicate employee_id", dupes)
+    with dq3:
+        invalid_scores = int(((scores["risk_score"] < 0) | (scores["risk_score"] > 1)).sum())
+        st.metric("Invalid risk scores", invalid_scores)
+
+    st.dataframe(missing_by_col)
+
+
+@st.fragment
+def _render_dept_overview(scores: pd.DataFrame) -> None:
+    st.subheader("Department Risk Overview")
+    dept_summary = _dept_summary(scores)
+    st.plotly_chart(_dept_overview_fig(dept_summary), use_container_width=True)
+
+
+@st.fragment
+def _render_engagement_vs_risk(scores: pd.DataFrame) -> None:
+    st.subheader("Engagement vs Risk")
+    st.plotly_chart(_engagement_vs_risk_fig(scores), use_container_width=True)
+
+
+@st.fragment
+def _render_watchlist(scores: pd.DataFrame) -> None:
+    st.subheader("High Risk Watchlist")
+    watchlist = scores.nlargest(15, "risk_score")
+    st.dataframe(watchlist)
+
+
+@st.fragment
+def _render_scored_output(scores: pd.DataFrame) -> None:
+    st.subheader("Scored Output")
+    st.dataframe(scores.head(50))
+    st.download_button(
+        "Download scored output CSV",
+        data=_df_to_csv_bytes(scores),
+        file_name="retention_scores.csv",
+        mime="text/csv",
+    )
 
 
 st.set_page_config(page_title="RadarRoster Retention Guard", layout="wide")
@@ -73,7 +311,6 @@ with st.sidebar:
     use_sample = st.checkbox("Use sample data", value=True)
     rows = st.slider("Sample rows", min_value=50, max_value=1000, value=200, step=50)
     input_file = st.file_uploader("Upload HR CSV", type=["csv"])
-    output_path = Path("outputs/retention_scores.csv")
     run_btn = st.button("Run Pipeline")
     st.markdown("---")
     st.subheader("Download templates")
@@ -81,7 +318,7 @@ with st.sidebar:
     if sample_path.exists():
         st.download_button(
             "Download sample CSV",
-            data=sample_path.read_bytes(),
+            data=_read_file_bytes(sample_path),
             file_name="sample_hr_data.csv",
             mime="text/csv",
         )
@@ -96,132 +333,25 @@ peer_turnover_rate, performance_score, internal_mobility
 
 if run_btn:
     if use_sample:
-        # Sample flow: generates realistic-but-fake data for safe demos.
-        result = run_pipeline(None, output_path, True, rows)
+        scores, feature_importance, auc = _cached_run(None, True, rows)
         st.success("Sample pipeline completed.")
-        source_df = pd.read_csv(output_path)
     elif input_file is not None:
-        # Upload flow: stores the file locally before running the pipeline.
-        df = pd.read_csv(input_file)
-        temp_path = Path("outputs/upload.csv")
-        temp_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(temp_path, index=False)
-        result = run_pipeline(temp_path, output_path, False, rows)
+        # rows only applies to sample data; a constant keeps one cache entry per upload.
+        scores, feature_importance, auc = _cached_run(input_file.getvalue(), False, 0)
         st.success("Pipeline completed with uploaded data.")
-        source_df = pd.read_csv(output_path)
     else:
         st.error("Upload a CSV or use sample data.")
         st.stop()
 
-    scores = source_df.copy()
-
-    st.subheader("Executive Snapshot")
-    kpi1, kpi2, kpi3, kpi4 = st.columns(4)
-    high_risk = scores[scores["risk_score"] >= 0.7]
-    with kpi1:
-        st.metric("Employees scored", len(scores))
-    with kpi2:
-        st.metric("High risk count", len(high_risk))
-    with kpi3:
-        st.metric("Avg risk score", f"{scores['risk_score'].mean():.2f}")
-    with kpi4:
-        high_pct = (len(high_risk) / len(scores)) * 100 if len(scores) else 0
-        st.metric("High risk %", f"{high_pct:.1f}%")
-
-    with st.expander("What does the model output mean?", expanded=False):
-        st.write(
-            "- **Risk score** is a 0–1 probability estimate from a baseline model.\n"
-            "- **Risk band** groups scores into Low (<0.4), Medium (0.4–0.69), High (>=0.7).\n"
-            "- **Top drivers** are the strongest overall model signals, not per-employee explanations."
-        )
-    with st.expander("How to interpret results", expanded=False):
-        st.write(
-            "- Use **High risk** to prioritize reviews, not to automate decisions.\n"
-            "- Compare **departments** to spot systemic issues.\n"
-            "- Track **engagement vs risk** to validate survey quality.\n"
-            "- Use the **scored CSV** as a starting point for deeper analysis."
-        )
-
-    st.subheader("Risk Distribution")
-    fig = px.histogram(scores, x="risk_score", nbins=20)
-    st.plotly_chart(fig, use_container_width=True)
-
-    st.subheader("Risk Bands")
-    band_counts = (
-        scores["risk_band"]
-        .value_counts()
-        .reset_index()
-        .rename(columns={"index": "risk_band", "risk_band": "count"})
-    )
-    band_counts["risk_band"] = pd.Categorical(
-        band_counts["risk_band"], categories=["Low", "Medium", "High"], ordered=True
-    )
-    band_counts = band_counts.sort_values("risk_band")
-    band_fig = px.bar(band_counts, x="risk_band", y="count")
-    st.plotly_chart(band_fig, use_container_width=True)
-
-    st.subheader("Top Drivers (overall)")
-    drivers = pd.DataFrame(result.feature_importance.items(), columns=["feature", "weight"])
-    drivers = drivers.sort_values("weight", ascending=True)
-    driver_fig = px.bar(drivers, x="weight", y="feature", orientation="h")
-    st.plotly_chart(driver_fig, use_container_width=True)
-
-    st.subheader("Data Quality & Coverage")
-    dq1, dq2, dq3 = st.columns(3)
-    with dq1:
-        st.metric("Missing values", int(source_df.isna().sum().sum()))
-    with dq2:
-        dupes = int(source_df["employee_id"].duplicated().sum())
-        st.metric("Duplicate employee_id", dupes)
-    with dq3:
-        invalid_scores = int(((scores["risk_score"] < 0) | (scores["risk_score"] > 1)).sum())
-        st.metric("Invalid risk scores", invalid_scores)
-
-    missing_by_col = (
-        source_df.isna()
-        .sum()
-        .reset_index()
-        .rename(columns={"index": "column", 0: "missing"})
-    )
-    st.dataframe(missing_by_col)
-
-    st.subheader("Department Risk Overview")
-    dept_summary = (
-        scores.groupby("dept", as_index=False)
-        .agg(avg_risk=("risk_score", "mean"), employees=("employee_id", "count"))
-        .sort_values("avg_risk", ascending=False)
-    )
-    dept_fig = px.bar(
-        dept_summary,
-        x="dept",
-        y="avg_risk",
-        color="employees",
-        color_continuous_scale="Blues",
-    )
-    st.plotly_chart(dept_fig, use_container_width=True)
-
-    st.subheader("Engagement vs Risk")
-    scatter_fig = px.scatter(
-        scores,
-        x="engagement_score",
-        y="risk_score",
-        color="risk_band",
-        hover_data=["employee_id", "dept"],
-    )
-    st.plotly_chart(scatter_fig, use_container_width=True)
-
-    st.subheader("High Risk Watchlist")
-    watchlist = scores.sort_values("risk_score", ascending=False).head(15)
-    st.dataframe(watchlist)
-
-    st.subheader("Scored Output")
-    st.dataframe(scores.head(50))
-    st.download_button(
-        "Download scored output CSV",
-        data=scores.to_csv(index=False).encode("utf-8"),
-        file_name="retention_scores.csv",
-        mime="text/csv",
-    )
+    _render_executive_snapshot(scores)
+    _render_risk_distribution(scores)
+    _render_risk_bands(scores)
+    _render_top_drivers(feature_importance)
+    _render_data_quality(scores)
+    _render_dept_overview(scores)
+    _render_engagement_vs_risk(scores)
+    _render_watchlist(scores)
+    _render_scored_output(scores)
 
 st.markdown("---")
 st.caption(
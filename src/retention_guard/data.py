@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -24,6 +24,9 @@ REQUIRED_COLUMNS = [
     "performance_score",
     "internal_mobility",
 ]
+CATEGORICAL_COLUMNS = ["dept", "salary_band"]
+DEPARTMENTS = ["HR", "Sales", "Engineering", "Finance", "Ops"]
+SALARY_BANDS = ["A", "B", "C", "D"]
 
 
 @dataclass
@@ -32,15 +35,25 @@ class SampleConfig:
     seed: int = 42
 
 
-def load_csv(path: Path) -> pd.DataFrame:
-    """Load a CSV and ensure required columns are present.
+def load_csv(path: Union[Path, BinaryIO]) -> pd.DataFrame:
+    """Load a CSV (file path or in-memory buffer) and ensure required columns are present.
 
     Forking tip: expand REQUIRED_COLUMNS to match your HR data model.
     """
-    df = pd.read_csv(path)
+    try:
+        # pyarrow's multithreaded parser is much faster on large files.
+        df = pd.read_csv(path, engine="pyarrow")
+    except (ImportError, pd.errors.ParserError):
+        # pyarrow is optional, and stricter than the C parser: it rejects short rows
+        # (e.g. trailing empty cells trimmed by Excel) that the C parser pads with NaN.
+        if hasattr(path, "seek"):
+            path.seek(0)
+        df = pd.read_csv(path)
     missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
     if missing:
         raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    # Low-cardinality labels: categoricals are smaller and faster to group/encode.
+    df[CATEGORICAL_COLUMNS] = df[CATEGORICAL_COLUMNS].astype("category")
     return df
 
 
@@ -55,21 +68,26 @@ def generate_sample(config: Optional[SampleConfig] = None) -> pd.DataFrame:
     rng = np.random.default_rng(config.seed)
     rows = config.rows
 
-    dept = rng.choice(["HR", "Sales", "Engineering", "Finance", "Ops"], size=rows)
-    tenure = rng.integers(3, 120, size=rows)
-    last_promo = np.maximum(0, tenure - rng.integers(0, 60, size=rows))
-    salary_band = rng.choice(["A", "B", "C", "D"], size=rows, p=[0.2, 0.4, 0.3, 0.1])
-    manager_span = rng.integers(3, 15, size=rows)
+    dept = pd.Categorical(rng.choice(DEPARTMENTS, size=rows), categories=DEPARTMENTS)
+    # Narrow integer dtypes: the ranges fit in int8/int16. Floats stay float64 so
+    # the rounded values display exactly (float32 cannot represent e.g. 67.1).
+    tenure = rng.integers(3, 120, size=rows, dtype=np.int16)
+    last_promo = np.maximum(0, tenure - rng.integers(0, 60, size=rows, dtype=np.int16))
+    salary_band = pd.Categorical(
+        rng.choice(SALARY_BANDS, size=rows, p=[0.2, 0.4, 0.3, 0.1]), categories=SALARY_BANDS
+    )
+    manager_span = rng.integers(3, 15, size=rows, dtype=np.int16)
     overtime = rng.normal(8, 6, size=rows).clip(0)
     engagement = rng.normal(72, 12, size=rows).clip(30, 98)
     absenteeism = rng.normal(1.5, 1.0, size=rows).clip(0, 6)
     peer_turnover = rng.uniform(0.02, 0.35, size=rows)
     performance = rng.normal(74, 10, size=rows).clip(40, 98)
-    mobility = rng.choice([0, 1], size=rows, p=[0.7, 0.3])
+    mobility = rng.choice([0, 1], size=rows, p=[0.7, 0.3]).astype(np.int8)
+    employee_ids = np.char.add("E", np.arange(1000, 1000 + rows).astype(str))
 
     data = pd.DataFrame(
         {
-            "employee_id": [f"E{1000 + idx}" for idx in range(rows)],
+            "employee_id": employee_ids,
             "dept": dept,
             "tenure_months": tenure,
             "last_promotion_months": last_promo,
@@ -3,20 +3,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import TYPE_CHECKING, Dict, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.compose import ColumnTransformer
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import roc_auc_score
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
-from retention_guard.data import REQUIRED_COLUMNS
+from retention_guard.data import CATEGORICAL_COLUMNS, REQUIRED_COLUMNS
+
+# sklearn is imported inside the functions that need it so importing this
+# module (e.g. on every Streamlit rerun) stays cheap until a model is trained.
+if TYPE_CHECKING:
+    from sklearn.base import ClassifierMixin
+    from sklearn.pipeline import Pipeline
 
 
 TARGET_COLUMN = "exit_flag"
+ESTIMATORS = ("logistic", "random_forest")
+TOP_DRIVERS = 8
 
 
 @dataclass
@@ -24,47 +27,89 @@ class ModelResult:
     model: Pipeline
     auc: float
     feature_importance: Dict[str, float]
-
-
-def _build_pipeline(cat_features: list[str], num_features: list[str]) -> Pipeline:
+    train_proba: np.ndarray
+
+
+def _build_estimator(name: str) -> ClassifierMixin:
+    if name == "logistic":
+        from sklearn.linear_model import LogisticRegression
+
+        return LogisticRegression(max_iter=200, class_weight="balanced")
+    if name == "random_forest":
+        from sklearn.ensemble import RandomForestClassifier
+
+        # Production-like mode: slower to fit, captures non-linear interactions.
+        return RandomForestClassifier(
+            n_estimators=200,
+            max_depth=6,
+            random_state=42,
+            class_weight="balanced",
+            n_jobs=-1,
+        )
+    raise ValueError(f"Unknown estimator: {name}. Choose from {', '.join(ESTIMATORS)}.")
+
+
+def _build_pipeline(
+    cat_features: list[str],
+    num_features: list[str],
+    estimator: ClassifierMixin | None = None,
+) -> Pipeline:
+    from sklearn.compose import ColumnTransformer
+    from sklearn.impute import SimpleImputer
+    from sklearn.pipeline import Pipeline, make_pipeline
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    # Impute first: LogisticRegression, unlike RandomForest, rejects NaN. Keep
+    # all-NaN columns so the output stays aligned with num_features.
+    num_pipeline = make_pipeline(
+        SimpleImputer(strategy="median", keep_empty_features=True), StandardScaler()
+    )
     preprocessor = ColumnTransformer(
         [
-            ("num", StandardScaler(), num_features),
+            ("num", num_pipeline, num_features),
             ("cat", OneHotEncoder(handle_unknown="ignore"), cat_features),
         ]
     )
-    model = RandomForestClassifier(
-        n_estimators=200,
-        max_depth=6,
-        random_state=42,
-        class_weight="balanced",
-    )
-    return Pipeline([("prep", preprocessor), ("model", model)])
+    if estimator is None:
+        estimator = _build_estimator("logistic")
+    return Pipeline([("prep", preprocessor), ("model", estimator)])
 
 
-def train_model(df: pd.DataFrame) -> ModelResult:
+def train_model(df: pd.DataFrame, estimator: str = "logistic") -> ModelResult:
     """Train a baseline model and return performance + top drivers.
 
-    Forking tip: swap RandomForest with XGBoost/LightGBM and add validation.
+    Forking tip: use estimator="random_forest" (or plug in XGBoost/LightGBM)
+    and add validation when moving beyond demos.
     """
+    from sklearn.metrics import roc_auc_score
+
     if TARGET_COLUMN not in df.columns:
         raise ValueError("Training data must include exit_flag column.")
 
     features = [col for col in REQUIRED_COLUMNS if col in df.columns]
-    cat_features = ["dept", "salary_band"]
+    cat_features = list(CATEGORICAL_COLUMNS)
     num_features = [col for col in features if col not in cat_features and col != "employee_id"]
 
-    x = df[features].copy()
+    x = df[features]
     y = df[TARGET_COLUMN].astype(int).values
 
-    pipeline = _build_pipeline(cat_features=cat_features, num_features=num_features)
+    pipeline = _build_pipeline(
+        cat_features=cat_features,
+        num_features=num_features,
+        estimator=_build_estimator(estimator),
+    )
     pipeline.fit(x, y)
 
     proba = pipeline.predict_proba(x)[:, 1]
     auc = roc_auc_score(y, proba)
 
-    feature_importance = _extract_feature_importance(pipeline, cat_features, num_features)
-    return ModelResult(model=pipeline, auc=auc, feature_importance=feature_importance)
+    feature_importance = _extract_feature_importance(pipeline, cat_features, num_features, x)
+    return ModelResult(
+        model=pipeline,
+        auc=auc,
+        feature_importance=feature_importance,
+        train_proba=proba,
+    )
 
 
 def score(model: Pipeline, df: pd.DataFrame) -> np.ndarray:
@@ -77,7 +122,7 @@ def score(model: Pipeline, df: pd.DataFrame) -> np.ndarray:
 
 
 def _extract_feature_importance(
-    pipeline: Pipeline, cat_features: list[str], num_features: list[str]
+    pipeline: Pipeline, cat_features: list[str], num_features: list[str], x: pd.DataFrame
 ) -> Dict[str, float]:
     model = pipeline.named_steps["model"]
     prep = pipeline.named_steps["prep"]
@@ -85,6 +130,20 @@ def _extract_feature_importance(
     cat_names = list(prep.named_transformers_["cat"].get_feature_names_out(cat_features))
     feature_names = num_features + cat_names
 
-    importances = model.feature_importances_
-    pairs = sorted(zip(feature_names, importances), key=lambda x: x[1], reverse=True)
-    return {name: float(weight) for name, weight in pairs[:8]}
+    if hasattr(model, "feature_importances_"):
+        importances = model.feature_importances_
+    else:
+        # Linear models: raw coefficients are not comparable across feature types
+        # (numeric columns are standardized, one-hot dummies are 0/1), so weight each
+        # |coef| by its encoded column's std before normalizing to sum to 1.
+        encoded = prep.transform(x)
+        if hasattr(encoded, "toarray"):
+            encoded = encoded.toarray()
+        weights = np.abs(model.coef_[0]) * encoded.std(axis=0)
+        total = weights.sum()
+        importances = weights / total if total else weights
+    # Partial selection of the top drivers, then sort only those.
+    top_k = min(TOP_DRIVERS, len(importances))
+    idx = np.argpartition(importances, -top_k)[-top_k:]
+    idx = idx[np.argsort(importances[idx])[::-1]]
+    return {feature_names[i]: float(importances[i]) for i in idx}
@@ -4,20 +4,22 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from retention_guard.data import SampleConfig, generate_sample, load_csv
-from retention_guard.model import ModelResult, score, train_model
+from retention_guard.model import ESTIMATORS, ModelResult, train_model
 
 
-def _infer_risk_band(score_value: float) -> str:
-    if score_value >= 0.7:
-        return "High"
-    if score_value >= 0.4:
-        return "Medium"
-    return "Low"
+RISK_BAND_BINS = [-np.inf, 0.4, 0.7, np.inf]
+RISK_BAND_LABELS = ["Low", "Medium", "High"]
+
+
+def _infer_risk_band(scores: pd.Series) -> pd.Series:
+    # Bins are closed on the left: Low < 0.4 <= Medium < 0.7 <= High.
+    return pd.cut(scores, bins=RISK_BAND_BINS, labels=RISK_BAND_LABELS, right=False)
 
 
 def _top_driver_summary(importances: dict[str, float]) -> str:
@@ -33,27 +35,34 @@ def _prepare_training_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # Create a synthetic label using a simple heuristic for demo purposes.
     # Forking tip: replace this with your real attrition label when available.
+    # Only the first mask is cast: int8 + bool stays int8 (bool + bool would be OR).
     heuristic = (
-        (df["engagement_score"] < 60).astype(int)
-        + (df["overtime_hours_month"] > 12).astype(int)
-        + (df["absenteeism_days_month"] > 3).astype(int)
-        + (df["last_promotion_months"] > 36).astype(int)
+        (df["engagement_score"] < 60).to_numpy(dtype=np.int8)
+        + (df["overtime_hours_month"] > 12).to_numpy()
+        + (df["absenteeism_days_month"] > 3).to_numpy()
+        + (df["last_promotion_months"] > 36).to_numpy()
     )
-    df = df.copy()
-    df["exit_flag"] = (heuristic >= 2).astype(int)
-    return df
+    return df.assign(exit_flag=(heuristic >= 2).view(np.int8))
 
 
 def run_pipeline(
-    input_path: Optional[Path],
-    output_path: Path,
+    input_path: Optional[Union[Path, BinaryIO]],
+    output_path: Optional[Path],
     generate_sample_flag: bool,
     rows: int,
-) -> ModelResult:
-    """Run the full pipeline and write the scored output CSV.
+    estimator: str = "logistic",
+    write_csv: bool = True,
+) -> tuple[ModelResult, pd.DataFrame]:
+    """Run the full pipeline and return the model result plus scored output.
+
+    The scored output is also written to ``output_path`` unless ``write_csv`` is False,
+    in which case ``output_path`` may be None.
 
     Forking tip: add your own feature engineering before training and scoring.
     """
+    if write_csv and output_path is None:
+        raise ValueError("Provide --output or set write_csv=False.")
+
     if generate_sample_flag:
         df = generate_sample(SampleConfig(rows=rows))
     elif input_path is not None:
@@ -62,8 +71,9 @@ def run_pipeline(
         raise ValueError("Provide --input or --generate-sample.")
 
     training_df = _prepare_training_data(df)
-    result = train_model(training_df)
-    risk_scores = score(result.model, df)
+    result = train_model(training_df, estimator=estimator)
+    # Training rows are the scored rows, so reuse the probabilities from fitting.
+    risk_scores = pd.Series(result.train_proba.round(3), index=df.index)
 
     output_columns = [
         "employee_id",
@@ -77,13 +87,20 @@ def run_pipeline(
         "peer_turnover_rate",
         "internal_mobility",
     ]
-    output = df[output_columns].copy()
-    output["risk_score"] = risk_scores.round(3)
-    output["risk_band"] = output["risk_score"].apply(_infer_risk_band)
-    output["top_driver"] = _top_driver_summary(result.feature_importance)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output.to_csv(output_path, index=False)
-    return result
+    # Build the output in one go; copy=False reuses df's columns rather than copying them.
+    output = pd.DataFrame(
+        {
+            **{col: df[col] for col in output_columns},
+            "risk_score": risk_scores,
+            "risk_band": _infer_risk_band(risk_scores),
+            "top_driver": _top_driver_summary(result.feature_importance),
+        },
+        copy=False,
+    )
+    if write_csv:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output.to_csv(output_path, index=False)
+    return result, output
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -96,13 +113,21 @@ def build_parser() -> argparse.ArgumentParser:
         help="Generate a synthetic dataset for demo use.",
     )
     parser.add_argument("--rows", type=int, default=200, help="Rows for sample data.")
+    parser.add_argument(
+        "--estimator",
+        choices=ESTIMATORS,
+        default="logistic",
+        help="Model to train (random_forest is slower, production-like).",
+    )
     return parser
 
 
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
-    result = run_pipeline(args.input, args.output, args.generate_sample, args.rows)
+    result, _ = run_pipeline(
+        args.input, args.output, args.generate_sample, args.rows, args.estimator
+    )
     print(f"Model AUC (train): {result.auc:.3f}")
     print("Top drivers:")
     for name, weight in result.feature_importance.items():